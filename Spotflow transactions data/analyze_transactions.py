@@ -14,13 +14,16 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import sys
-from collections import Counter, defaultdict
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 import re
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 REGIONS = [
     "Nigeria",
@@ -34,8 +37,10 @@ REGIONS = [
     "Egypt",
     "Cameroon",
 ]
-REGION_SET = set(REGIONS)
-PROVIDERS = {
+# Keyword sets hold interned strings; extract_transactions interns the values it
+# emits so membership checks and counter keys hit on identity.
+REGION_SET = frozenset(map(sys.intern, REGIONS))
+PROVIDERS = frozenset(map(sys.intern, [
     "cellulant",
     "hubtel",
     "interswitch",
@@ -47,40 +52,91 @@ PROVIDERS = {
     "hub2",
     "kashier",
     "pawapay",
+]))
+STATUSES = frozenset(map(sys.intern, ["successful", "failed", "abandoned", "cancelled", "inprogress"]))
+CHANNELS = frozenset(map(sys.intern, ["card", "bank_transfer", "eft", "mobile_money"]))
+MODES = frozenset({"live", "test"})
+# Suffixes marking a following transaction glued onto a message by a merged row.
+PROVIDER_MARKERS = tuple(f",{provider}" for provider in PROVIDERS)
+REGION_MARKERS = tuple(f",{region.lower()}" for region in REGION_SET)
+# Keyword classes used by extract_transactions, looked up on lowercased cells.
+# Any other cell classifies as None.
+TOKEN_PROVIDER, TOKEN_STATUS, TOKEN_CHANNEL = range(3)
+KEYWORD_CLASSES = {
+    **dict.fromkeys(PROVIDERS, TOKEN_PROVIDER),
+    **dict.fromkeys(STATUSES, TOKEN_STATUS),
+    **dict.fromkeys(CHANNELS, TOKEN_CHANNEL),
 }
-STATUSES = {"successful", "failed", "abandoned", "cancelled", "inprogress"}
-CHANNELS = {"card", "bank_transfer", "eft", "mobile_money"}
-ISO_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T")
 DEFAULT_TZ_SUFFIX = "+00:00"
 DEFAULT_DATE_PLACEHOLDER = "<missing-date>"
 BLANK_MESSAGE = "<blank>"
+PARALLEL_CHUNK_ROWS = 5000
+BLANK_MARKERS = frozenset({",", ",,", '""', "''"})
+BLANK_FIRST_LINES = frozenset({",", ",,", ".", "-"})
+OTP_PREFIXES = (
+    "kindly enter the otp",
+    "please enter the otp",
+    "please input the otp",
+)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+STRAY_FRAGMENT_PATTERN = re.compile(r'"\s*,')
+TRAILING_PUNCTUATION_PATTERN = re.compile(r'[\s,;:."-]+$')
+UPPERCASE_TOKEN_PATTERN = re.compile(r"\b[A-Z]{2,}\b")
 
 
 @dataclass
 class ProviderSummary:
     status_counts: Counter = field(default_factory=Counter)
     channel_counts: Counter = field(default_factory=Counter)
-    messages_by_status: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    message_counts: Counter = field(default_factory=Counter)  # keyed by (status, message)
 
 
 @dataclass
 class RegionSummary:
-    times: List[datetime] = field(default_factory=list)
+    time_min: Optional[datetime] = None
+    time_max: Optional[datetime] = None
     status_counts: Counter = field(default_factory=Counter)
     channel_counts: Counter = field(default_factory=Counter)
-    messages_by_status: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    message_counts: Counter = field(default_factory=Counter)  # keyed by (status, message)
     providers: Dict[str, ProviderSummary] = field(default_factory=lambda: defaultdict(ProviderSummary))
 
 
+class ColumnLayout(NamedTuple):
+    """Header positions used to read well-formed rows without scanning them."""
+
+    width: int
+    provider: int  # region and customer follow in the next two columns
+    status: int
+    channel: int
+    message: int
+    date: int
+
+
+def messages_for_status(message_counts: Counter, status: str) -> Counter:
+    """Return the message counts recorded under ``status``, in first-seen order."""
+    return Counter({message: count for (s, message), count in message_counts.items() if s == status})
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_pattern(word: str) -> re.Pattern:
+    """Compiled whole-word pattern for ``word``; acronyms repeat across messages."""
+    return re.compile(r"\b" + re.escape(word) + r"\b")
+
+
+@functools.lru_cache(maxsize=65536)
 def _normalise_message(message: str) -> str:
-    """Coerce provider messages into consistent, comparable buckets."""
+    """Coerce provider messages into consistent, comparable buckets.
+
+    Memoised: exports repeat a small set of provider messages many times over.
+    """
     if message is None:
         return BLANK_MESSAGE
 
-    cleaned = message.replace("\r\n", "\n").strip()
-    if not cleaned or cleaned in {",", ",,", '""', "''"}:
+    cleaned = message.strip()
+    if not cleaned or cleaned in BLANK_MARKERS:
         return BLANK_MESSAGE
 
+    # strip() also drops the "\r" left behind by a CRLF line break.
     first_line = cleaned.split("\n", 1)[0].strip()
     if first_line.startswith('"') and first_line.endswith('"') and len(first_line) > 1:
         first_line = first_line[1:-1].strip()
@@ -88,19 +144,19 @@ def _normalise_message(message: str) -> str:
     # Remove stray unmatched quotes after stripping leading/trailing ones
     first_line = first_line.strip('"').strip()
 
-    if not first_line or first_line in {",", ",,", ".", "-"}:
+    if not first_line or first_line in BLANK_FIRST_LINES:
         return BLANK_MESSAGE
 
-    first_line = first_line.replace("\xa0", " ")
-    first_line = re.sub(r"\s+", " ", first_line).strip()
+    # \s also matches non-breaking spaces, so this normalises "\xa0" too.
+    first_line = WHITESPACE_PATTERN.sub(" ", first_line).strip()
 
     # Handle cases where malformed CSV rows append additional fragments such as
     # `",has insufficient funds...` to an otherwise valid message.
-    stray_split = re.split(r'"\s*,', first_line, maxsplit=1)
+    stray_split = STRAY_FRAGMENT_PATTERN.split(first_line, maxsplit=1)
     if len(stray_split) > 1 and stray_split[0].strip():
         first_line = stray_split[0].strip()
 
-    first_line = re.sub(r'[\s,;:."-]+$', '', first_line).strip()
+    first_line = TRAILING_PUNCTUATION_PATTERN.sub("", first_line).strip()
 
     if "_" in first_line:
         candidate = first_line.replace("_", " ").strip()
@@ -112,74 +168,187 @@ def _normalise_message(message: str) -> str:
 
     first_line_lower = first_line.lower()
 
-    otp_patterns = [
-        "kindly enter the otp",
-        "please enter the otp",
-        "please input the otp",
-    ]
-    if any(first_line_lower.startswith(pattern) for pattern in otp_patterns):
+    if first_line_lower.startswith(OTP_PREFIXES):
         first_line = "OTP verification required"
         return first_line
 
     uppercase_tokens = {
         match.group(0)
-        for match in re.finditer(r"\b[A-Z]{2,}\b", first_line)
+        for match in UPPERCASE_TOKEN_PATTERN.finditer(first_line)
         if len(match.group(0)) <= 4
     }
 
     for token in uppercase_tokens:
-        first_line_lower = re.sub(
-            r"\b" + re.escape(token.lower()) + r"\b", token, first_line_lower
-        )
+        first_line_lower = _word_pattern(token.lower()).sub(token, first_line_lower)
 
     first_line = first_line_lower[:1].upper() + first_line_lower[1:] if first_line_lower else first_line_lower
 
     return first_line
 
 
-def _find_next_provider_index(row: List[str], start: int) -> Optional[int]:
-    n = len(row)
-    for idx in range(start, n - 1):
-        provider = row[idx].strip().lower()
-        region = row[idx + 1].strip()
-        if provider in PROVIDERS and region in REGION_SET:
-            return idx
-    return None
+def _provider_boundaries(stripped: List[str], classes: List[Optional[int]]) -> List[int]:
+    """Return, in order, every index where a provider token is followed by a region."""
+    return [
+        idx
+        for idx in range(len(stripped) - 1)
+        if classes[idx] == TOKEN_PROVIDER and stripped[idx + 1] in REGION_SET
+    ]
+
+
+def _is_iso_timestamp(token: str) -> bool:
+    r"""Return True if ``token`` starts with ``YYYY-MM-DDT``.
+
+    Same test as the regex ``^\d{4}-\d{2}-\d{2}T``, but most tokens are
+    rejected by the length and ``T`` checks without entering the regex engine.
+    """
+    return (
+        len(token) > 10
+        and token[10] == "T"
+        and token[4] == "-"
+        and token[7] == "-"
+        and token[:4].isdecimal()
+        and token[5:7].isdecimal()
+        and token[8:10].isdecimal()
+    )
+
+
+def _is_number(token: str) -> bool:
+    if not token:
+        return False
+    token = token.replace(",", "")
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+def _trim_message(message: str) -> str:
+    """Cut off a following transaction glued onto ``message`` and unwrap quotes."""
+    if message:
+        lower_message = message.lower()
+        for marker in PROVIDER_MARKERS:
+            pos = lower_message.find(marker)
+            if pos != -1:
+                message = message[:pos]
+                lower_message = message.lower()
+                break
+        for marker in REGION_MARKERS:
+            pos = lower_message.find(marker)
+            if pos != -1:
+                message = message[:pos]
+                lower_message = message.lower()
+                break
+    if message.startswith('"') and message.endswith('"'):
+        message = message[1:-1]
+    return message
+
+
+def _extract_well_formed(row: List[str], layout: ColumnLayout) -> Optional[Tuple[str, str, str, str, str, str, str]]:
+    """Read a single-transaction row straight from its header columns.
+
+    Returns None whenever the token scanner in extract_transactions could read
+    the row differently, so the caller falls back to it.
+    """
+    width, provider_col, status_col, channel_col, message_col, date_col = layout
+    if len(row) != width:
+        return None
+    provider = row[provider_col].strip().lower()
+    region = row[provider_col + 1].strip()
+    customer = row[provider_col + 2].strip()
+    status = row[status_col].strip().lower()
+    channel = row[channel_col].strip().lower()
+    message = row[message_col].strip()
+    payment_date = row[date_col].strip()
+    if (
+        provider not in PROVIDERS
+        or region not in REGION_SET
+        or status not in STATUSES
+        or channel not in CHANNELS
+        or customer.lower() in STATUSES
+        or not _is_iso_timestamp(payment_date)
+    ):
+        return None
+
+    # Cells the scanner would treat differently: a channel ahead of the channel
+    # column, a mode cell it would not skip, or a message token it stops at.
+    for idx in range(status_col + 1, channel_col):
+        if row[idx].strip().lower() in CHANNELS:
+            return None
+    lower_message = message.lower()
+    if message_col == channel_col + 2:
+        if row[channel_col + 1].strip().lower() not in MODES:
+            return None
+    elif lower_message in MODES:
+        return None
+    if lower_message in KEYWORD_CLASSES or message in REGION_SET or "@" in message or _is_iso_timestamp(message):
+        return None
+
+    # No other transaction may start before the provider or after the date.
+    for idx in (*range(provider_col - 1), *range(date_col + 1, width - 1)):
+        if row[idx].strip().lower() in PROVIDERS and row[idx + 1].strip() in REGION_SET:
+            return None
+
+    return (
+        sys.intern(provider),
+        sys.intern(region),
+        sys.intern(status),
+        sys.intern(channel),
+        _trim_message(message),
+        payment_date,
+        customer.strip('"'),
+    )
+
 
+def extract_transactions(
+    row: List[str], default_dt: str, layout: Optional[ColumnLayout] = None
+) -> Iterable[Tuple[str, str, str, str, str, str, str]]:
+    """Yield (provider, region, status, channel, message, payment_date, customer).
+
+    When the header ``layout`` is known, well-formed rows skip the token scan.
+    """
+    if layout is not None:
+        transaction = _extract_well_formed(row, layout)
+        if transaction is not None:
+            yield transaction
+            return
 
-def extract_transactions(row: List[str], default_dt: str) -> Iterable[Tuple[str, str, str, str, str, str, str]]:
-    """Yield (provider, region, status, channel, message, payment_date, customer)."""
     n = len(row)
+    # Strip and lowercase every cell once; the scans below only index these.
+    stripped = list(map(str.strip, row))
+    lowered = list(map(str.lower, stripped))
+    classes = list(map(KEYWORD_CLASSES.get, lowered))
+    boundaries = _provider_boundaries(stripped, classes)
     i = 0
     while i < n:
-        provider_idx = _find_next_provider_index(row, i)
-        if provider_idx is None:
+        pos = bisect_left(boundaries, i)
+        if pos == len(boundaries):
             break
-        provider = row[provider_idx].strip().lower()
-        region = row[provider_idx + 1].strip()
+        provider_idx = boundaries[pos]
+        provider = sys.intern(lowered[provider_idx])
+        region = sys.intern(stripped[provider_idx + 1])
 
         idx = provider_idx + 2
         customer_parts: List[str] = []
-        while idx < n and row[idx].strip().lower() not in STATUSES:
-            token = row[idx].strip()
-            if token:
-                customer_parts.append(token)
+        while idx < n and classes[idx] != TOKEN_STATUS:
+            if stripped[idx]:
+                customer_parts.append(stripped[idx])
             idx += 1
         if idx >= n:
             i = provider_idx + 1
             continue
-        status = row[idx].strip().lower()
+        status = sys.intern(lowered[idx])
         idx += 1
 
-        while idx < n and row[idx].strip().lower() not in CHANNELS:
+        while idx < n and classes[idx] != TOKEN_CHANNEL:
             idx += 1
         if idx >= n:
             i = provider_idx + 1
             continue
-        channel = row[idx].strip().lower()
+        channel = sys.intern(lowered[idx])
         idx += 1  # move past channel
 
-        if idx < n and row[idx].strip().lower() in {"live", "test"}:
+        if idx < n and lowered[idx] in MODES:
             idx += 1  # skip mode column if present
 
         message_parts: List[str] = []
@@ -191,131 +360,259 @@ def extract_transactions(row: List[str], default_dt: str) -> Iterable[Tuple[str,
                 break
         if not customer and customer_parts:
             customer = customer_parts[0]
-        customer = customer.strip().strip('"')
+        customer = customer.strip('"')
 
         while idx < n:
-            raw = row[idx]
-            stripped = raw.strip()
-            if ISO_PATTERN.match(stripped):
-                payment_date = stripped
+            token = stripped[idx]
+            if _is_iso_timestamp(token):
+                payment_date = token
                 idx += 1
                 break
-            lower = stripped.lower()
-            lookahead = _find_next_provider_index(row, idx)
-            if lookahead is not None and lookahead == idx:
-                break
-            if lower in PROVIDERS or stripped in REGION_SET:
+            # Also stops at the start of the next transaction, which always
+            # begins with a provider token.
+            if classes[idx] is not None or token in REGION_SET or "@" in token:
                 break
-            if "@" in stripped or lower in STATUSES or lower in CHANNELS:
+            if idx + 1 < n and _is_number(stripped[idx + 1]):
                 break
-            next_token = row[idx + 1].strip() if idx + 1 < n else ""
-            def _is_number(token: str) -> bool:
-                if not token:
-                    return False
-                token = token.replace(",", "")
-                try:
-                    float(token)
-                    return True
-                except ValueError:
-                    return False
-            if next_token and _is_number(next_token):
-                break
-            message_parts.append(raw)
+            message_parts.append(row[idx])
             idx += 1
 
-        message = ",".join(message_parts).strip()
-        if message:
-            lower_message = message.lower()
-            for provider_token in PROVIDERS:
-                marker = f",{provider_token}"
-                pos = lower_message.find(marker)
-                if pos != -1:
-                    message = message[:pos]
-                    lower_message = message.lower()
-                    break
-            for region_token in REGION_SET:
-                marker = f",{region_token.lower()}"
-                pos = lower_message.find(marker)
-                if pos != -1:
-                    message = message[:pos]
-                    lower_message = message.lower()
-                    break
-        if message.startswith('"') and message.endswith('"'):
-            message = message[1:-1]
+        message = _trim_message(",".join(message_parts).strip())
         payment_date = payment_date or default_dt
 
         yield provider, region, status, channel, message, payment_date, customer
         i = idx
 
 
-def parse_csv(path: Path) -> Tuple[List[Tuple[str, str, str, str, str, datetime, str]], Dict[str, RegionSummary]]:
-    transactions: List[Tuple[str, str, str, str, str, datetime, str]] = []
-    summaries: Dict[str, RegionSummary] = defaultdict(RegionSummary)
-    aggregate = summaries["Aggregate"]
+Transaction = Tuple[str, str, str, str, str, Optional[datetime], str]
+# Region (or "Aggregate") -> [earliest, latest] payment datetime.
+TimeRanges = Dict[str, List[datetime]]
+
+
+def _default_payment_date(header: List[str]) -> str:
+    """Return the timestamp some exports carry in their header row, or the placeholder."""
+    default_dt = next((col.strip() for col in header if _is_iso_timestamp(col.strip())), None)
+    return default_dt or DEFAULT_DATE_PLACEHOLDER
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_payment_date(payment_date: str) -> Optional[datetime]:
+    """Parse an export timestamp, returning None for the missing-date placeholder.
+
+    Raises ValueError for any other value that is not an ISO 8601 timestamp.
+    """
+    if payment_date == DEFAULT_DATE_PLACEHOLDER:
+        return None
+    return datetime.fromisoformat(payment_date.replace("Z", DEFAULT_TZ_SUFFIX))
+
+
+def _column_layout(header: List[str]) -> Optional[ColumnLayout]:
+    """Return the fixed column positions of a well-formed row, if the header has them.
 
+    Only layouts the token scanner walks in the same order qualify: region,
+    customer and status directly after the provider, the message right after
+    the channel (or after a mode column), and the date right after the message.
+    """
+    names = [col.strip() for col in header]
+    try:
+        provider, region, customer, status, channel, message, date = (
+            names.index(name)
+            for name in (
+                "Provider",
+                "Region",
+                "Customer",
+                "Payment Status",
+                "Payment Channel",
+                "Provider Message",
+                "Payment Date",
+            )
+        )
+    except ValueError:
+        return None
+    if (region, customer, status) != (provider + 1, provider + 2, provider + 3):
+        return None
+    if channel <= status or message not in (channel + 1, channel + 2) or date != message + 1:
+        return None
+    return ColumnLayout(len(header), provider, status, channel, message, date)
+
+
+def _transactions_from_rows(
+    rows: Iterable[List[str]], default_dt: str, layout: Optional[ColumnLayout] = None
+) -> Iterator[Transaction]:
+    for row in rows:
+        if not row:
+            continue
+        for provider, region, status, channel, message, payment_date, customer in extract_transactions(row, default_dt, layout):
+            if region not in REGION_SET and region != "Aggregate":
+                continue
+            if status not in STATUSES:
+                continue
+            if channel not in CHANNELS:
+                channel = "other"
+
+            try:
+                dt = _parse_payment_date(payment_date)
+            except ValueError:
+                continue
+
+            yield provider, region, status, channel, _normalise_message(message), dt, customer
+
+
+def iter_transactions(path: Path) -> Iterator[Transaction]:
+    """Yield (provider, region, status, channel, message, datetime, customer) per transaction.
+
+    Rows are read and normalised lazily, so callers can aggregate exports of
+    any size without holding the transactions in memory.
+    """
     with path.open(newline="", encoding="utf-8") as fh:
         reader = csv.reader(fh)
         header = next(reader, None)
         if header is None:
             raise ValueError("CSV file is empty")
-        default_dt = next((col for col in header if ISO_PATTERN.match(col.strip())), None)
-        if default_dt:
-            default_dt = default_dt.strip()
-        else:
-            default_dt = DEFAULT_DATE_PLACEHOLDER
+        yield from _transactions_from_rows(reader, _default_payment_date(header), _column_layout(header))
 
-        for row in reader:
-            if not row:
-                continue
-            for provider, region, status, channel, message, payment_date, customer in extract_transactions(row, default_dt):
-                if region not in REGION_SET and region != "Aggregate":
-                    continue
-                if status not in STATUSES:
-                    continue
-                if channel not in CHANNELS:
-                    channel = "other"
-
-                try:
-                    dt = datetime.fromisoformat(payment_date.replace("Z", DEFAULT_TZ_SUFFIX))
-                except ValueError:
-                    if payment_date == DEFAULT_DATE_PLACEHOLDER:
-                        dt = None
-                    else:
-                        continue
-
-                norm_message = _normalise_message(message)
-                key = (provider, region, status, channel, norm_message, dt, customer)
-                transactions.append(key)
-
-                target = summaries[region]
-                if dt:
-                    target.times.append(dt)
-                    aggregate.times.append(dt)
-
-                target.status_counts[status] += 1
-                target.channel_counts[channel] += 1
-                target.messages_by_status[status][norm_message] += 1
-
-                aggregate.status_counts[status] += 1
-                aggregate.channel_counts[channel] += 1
-                aggregate.messages_by_status[status][norm_message] += 1
-
-                provider_summary = target.providers[provider]
-                provider_summary.status_counts[status] += 1
-                provider_summary.channel_counts[channel] += 1
-                provider_summary.messages_by_status[status][norm_message] += 1
-
-                aggregate_provider_summary = aggregate.providers[provider]
-                aggregate_provider_summary.status_counts[status] += 1
-                aggregate_provider_summary.channel_counts[channel] += 1
-                aggregate_provider_summary.messages_by_status[status][norm_message] += 1
-
-    return transactions, summaries
+
+def _widen_time_range(ranges: TimeRanges, key: str, earliest: datetime, latest: datetime) -> None:
+    """Fold ``[earliest, latest]`` into ``ranges[key]``.
+
+    On ties the first-seen earliest and the last-seen latest value win, since
+    equal instants in different UTC offsets print differently.
+    """
+    bounds = ranges.get(key)
+    if bounds is None:
+        ranges[key] = [earliest, latest]
+        return
+    if earliest < bounds[0]:
+        bounds[0] = earliest
+    if latest >= bounds[1]:
+        bounds[1] = latest
+
+
+def _pivot_tally(tally: Counter, time_ranges: TimeRanges) -> Dict[str, RegionSummary]:
+    """Pivot grouped transaction counts back into per-region summaries.
+
+    ``tally`` is keyed by ``(region, provider, status, channel, message)``, so
+    the summaries are built once per distinct combination instead of once per
+    transaction. Counters keep first-seen order because the tally does.
+    """
+    summaries: Dict[str, RegionSummary] = defaultdict(RegionSummary)
+    aggregate = summaries["Aggregate"]
+
+    for (region, provider, status, channel, norm_message), count in tally.items():
+        for target in (summaries[region], aggregate):
+            target.status_counts[status] += count
+            target.channel_counts[channel] += count
+            target.message_counts[status, norm_message] += count
+
+            provider_summary = target.providers[provider]
+            provider_summary.status_counts[status] += count
+            provider_summary.channel_counts[channel] += count
+            provider_summary.message_counts[status, norm_message] += count
+
+    for region, (earliest, latest) in time_ranges.items():
+        target = summaries[region]
+        target.time_min = earliest
+        target.time_max = latest
+
+    return summaries
+
+
+def _tally_transactions(transactions: Iterable[Transaction]) -> Tuple[Counter, TimeRanges]:
+    time_ranges: TimeRanges = {}
+
+    def keys() -> Iterator[Tuple[str, str, str, str, str]]:
+        for provider, region, status, channel, norm_message, dt, _ in transactions:
+            if dt:
+                _widen_time_range(time_ranges, region, dt, dt)
+                _widen_time_range(time_ranges, "Aggregate", dt, dt)
+            yield region, provider, status, channel, norm_message
+
+    # Group first, fan out into the summaries once per distinct key. Counter()
+    # counts the whole key stream in C rather than one `+= 1` per transaction.
+    return Counter(keys()), time_ranges
+
+
+def summarise_transactions(transactions: Iterable[Transaction]) -> Dict[str, RegionSummary]:
+    """Aggregate a stream of transactions into per-region summaries in one pass."""
+    return _pivot_tally(*_tally_transactions(transactions))
+
+
+def _process_rows(
+    rows: List[List[str]], default_dt: str, layout: Optional[ColumnLayout], collect: bool
+) -> Tuple[List[Transaction], Counter, TimeRanges]:
+    """Worker entry point for parallel parsing: extract and tally one chunk of rows."""
+    transactions: Iterable[Transaction] = _transactions_from_rows(rows, default_dt, layout)
+    if collect:
+        transactions = list(transactions)
+    tally, time_ranges = _tally_transactions(transactions)
+    return transactions if collect else [], tally, time_ranges
+
+
+def _row_chunks(rows: Iterable[List[str]], size: int) -> Iterator[List[List[str]]]:
+    chunk: List[List[str]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _parse_csv_parallel(path: Path, jobs: int, collect: bool) -> Tuple[List[Transaction], Dict[str, RegionSummary]]:
+    # Rows are tokenised here rather than by byte range in the workers because
+    # quoted provider messages may span several physical lines.
+    transactions: List[Transaction] = []
+    tally: Counter = Counter()
+    time_ranges: TimeRanges = {}
+
+    def merge(result: Tuple[List[Transaction], Counter, TimeRanges]) -> None:
+        chunk_transactions, chunk_tally, chunk_ranges = result
+        transactions.extend(chunk_transactions)
+        tally.update(chunk_tally)
+        for region, (earliest, latest) in chunk_ranges.items():
+            _widen_time_range(time_ranges, region, earliest, latest)
+
+    with path.open(newline="", encoding="utf-8") as fh, ProcessPoolExecutor(max_workers=jobs) as executor:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError("CSV file is empty")
+        default_dt = _default_payment_date(header)
+        layout = _column_layout(header)
+
+        pending: Deque[Future] = deque()
+        for chunk in _row_chunks(reader, PARALLEL_CHUNK_ROWS):
+            pending.append(executor.submit(_process_rows, chunk, default_dt, layout, collect))
+            # Bound the rows in flight; merging in submission order keeps the
+            # first-seen ordering of the sequential path.
+            if len(pending) >= 2 * jobs:
+                merge(pending.popleft().result())
+        while pending:
+            merge(pending.popleft().result())
+
+    return transactions, _pivot_tally(tally, time_ranges)
+
+
+def parse_csv(
+    path: Path, collect: bool = True, jobs: int = 1
+) -> Tuple[List[Transaction], Dict[str, RegionSummary]]:
+    """Parse ``path`` into the transaction list and per-region summaries.
+
+    Pass ``collect=False`` to stream transactions straight into the summaries
+    without keeping them (the returned list is then empty).
+    With ``jobs > 1`` row extraction is spread over that many worker processes.
+    """
+    if jobs > 1:
+        return _parse_csv_parallel(path, jobs, collect)
+    if not collect:
+        return [], summarise_transactions(iter_transactions(path))
+    transactions = list(iter_transactions(path))
+    return transactions, summarise_transactions(transactions)
 
 
 def _print_status_block(status_counts: Counter) -> None:
-    total = sum(status_counts.values())
-    print(f"  Total transactions: {total}")
+    print(f"  Total transactions: {status_counts.total()}")
     for status in ["successful", "failed", "abandoned", "cancelled", "inprogress"]:
         if status in status_counts:
             print(f"    {status.title():<12}: {status_counts[status]}")
@@ -329,8 +626,8 @@ def _print_channel_block(channel_counts: Counter) -> None:
             print(f"    {channel.replace('_', ' ').title():<16}: {count}")
 
 
-def _print_top_reasons(messages_by_status: Dict[str, Counter], status: str, top_n: int) -> None:
-    reasons = messages_by_status.get(status)
+def _print_top_reasons(message_counts: Counter, status: str, top_n: int) -> None:
+    reasons = messages_for_status(message_counts, status)
     if not reasons:
         return
     label = "success" if status == "successful" else status
@@ -340,6 +637,11 @@ def _print_top_reasons(messages_by_status: Dict[str, Counter], status: str, top_
 
 
 def print_summary(summaries: Dict[str, RegionSummary], top_n: int) -> None:
+    aggregate = summaries.get("Aggregate")
+    if aggregate is None or not aggregate.status_counts:
+        print("No transactions found.")
+        return
+
     ordered_regions = REGIONS + ["Aggregate"]
     for region in ordered_regions:
         if region not in summaries:
@@ -348,29 +650,34 @@ def print_summary(summaries: Dict[str, RegionSummary], top_n: int) -> None:
         if not data.status_counts:
             continue
         print(f"\n=== {region} ===")
-        if data.times:
-            times_sorted = sorted(data.times)
+        if data.time_min is not None:
             print(
                 "  Date/time range: "
-                f"{times_sorted[0].isoformat()} to {times_sorted[-1].isoformat()}"
+                f"{data.time_min.isoformat()} to {data.time_max.isoformat()}"
             )
         _print_status_block(data.status_counts)
         _print_channel_block(data.channel_counts)
-        _print_top_reasons(data.messages_by_status, "successful", top_n)
-        _print_top_reasons(data.messages_by_status, "failed", top_n)
+        _print_top_reasons(data.message_counts, "successful", top_n)
+        _print_top_reasons(data.message_counts, "failed", top_n)
 
         if data.providers:
             print("  Provider breakdown:")
             for provider, pdata in sorted(data.providers.items()):
                 print(f"    - {provider}:")
-                total = sum(pdata.status_counts.values())
-                print(f"        Total: {total}")
+                print(f"        Total: {pdata.status_counts.total()}")
                 for status, count in pdata.status_counts.items():
                     print(f"        {status.title():<12}: {count}")
-                _print_top_reasons(pdata.messages_by_status, "successful", top_n)
-                _print_top_reasons(pdata.messages_by_status, "failed", top_n)
+                _print_top_reasons(pdata.message_counts, "successful", top_n)
+                _print_top_reasons(pdata.message_counts, "failed", top_n)
+
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Analyze Spotflow transaction exports.")
@@ -381,6 +688,16 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=5,
         help="Number of top success/failure messages to display (default: 5)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help=(
+            "Number of worker processes used to parse the CSV (default: 1). "
+            "Only helps on multi-core machines: rows are still read in the main "
+            "process and sent to the workers, which costs time on a single core."
+        ),
+    )
     return parser
 
 
@@ -392,7 +709,10 @@ def main(argv: Optional[List[str]] = None) -> int:
         parser.error(f"File not found: {args.csv_path}")
 
     try:
-        _, summaries = parse_csv(args.csv_path)
+        if args.jobs > 1:
+            _, summaries = parse_csv(args.csv_path, collect=False, jobs=args.jobs)
+        else:
+            summaries = summarise_transactions(iter_transactions(args.csv_path))
     except Exception as exc:  # noqa: BLE001
         print(f"Error parsing {args.csv_path}: {exc}", file=sys.stderr)
         return 1